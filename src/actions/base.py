@@ -92,6 +92,33 @@ class ActionConnector(ABC, T.Generic[CT, OT]):
         """
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release resources held by the connector.
+
+        Called on shutdown; the default implementation is a no-op.
+        Connectors holding pooled sessions, queues or worker tasks should
+        override this.
+        """
+        pass
+
+    async def __aenter__(self) -> "ActionConnector":
+        """
+        Enter the async context manager.
+
+        Returns
+        -------
+        ActionConnector
+            This connector.
+        """
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """
+        Exit the async context manager, releasing connector resources.
+        """
+        await self.aclose()
+
     def tick(self) -> None:
         """
         Tick method for periodic updates.
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+import orjson
+import yarl
+from pydantic import ConfigDict, Field
+
+from actions.base import ActionConfig, ActionConnector
+from actions.discord.interface import DiscordInput
+from providers._http import get_shared_session
+
+# Discord caps message content at 2000 characters; leave headroom for the
+# newline separators added when coalescing.
+MAX_COALESCED_LENGTH = 1900
+
+# How long the drain worker waits for additional messages before flushing.
+FLUSH_WINDOW = 0.1
+
+
+class DiscordAPIConnectorConfig(ActionConfig):
+    """
+    Configuration for the Discord API connector.
+
+    Parameters
+    ----------
+    webhook_url : str
+        The Discord webhook URL to post messages to.
+    timeout : int
+        Timeout for the HTTP requests in seconds.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    webhook_url: str = Field(
+        default="",
+        description="The Discord webhook URL to post messages to.",
+    )
+    timeout: int = Field(
+        default=10,
+        description="Timeout for the HTTP requests in seconds.",
+    )
+
+
+class DiscordAPIConnector(ActionConnector[DiscordAPIConnectorConfig, DiscordInput]):
+    """
+    Connector that posts messages to a Discord channel via a webhook.
+
+    Messages are queued and drained by a single background task that
+    coalesces bursts into one webhook call per flush window, so callers
+    never block on Discord's rate limiter or a network round-trip. A
+    single ``aiohttp.ClientSession`` is shared across all sends so repeat
+    posts reuse the pooled keep-alive connection to discord.com instead of
+    paying a fresh TCP+TLS handshake per message.
+    """
+
+    def __init__(self, config: DiscordAPIConnectorConfig):
+        """
+        Initialize the DiscordAPIConnector.
+
+        Parameters
+        ----------
+        config : DiscordAPIConnectorConfig
+            Configuration for the action connector.
+        """
+        super().__init__(config)
+
+        # Created lazily on first send because the queue and worker task
+        # must be bound to the running event loop.
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+
+        # Parse the webhook URL once; aiohttp accepts a yarl.URL without
+        # re-parsing it per request.
+        self._url: Optional[yarl.URL] = (
+            yarl.URL(self.config.webhook_url) if self.config.webhook_url else None
+        )
+        if self._url is None:
+            logging.error("DiscordAPI connector missing 'webhook_url' in config")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the process-wide shared HTTP session.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            The shared client session with a pooled keep-alive connector.
+        """
+        return get_shared_session()
+
+    async def connect(self, output_interface: DiscordInput) -> None:
+        """
+        Queue a message for delivery to Discord via the configured webhook.
+
+        The message is pushed onto the send queue and delivered by the
+        background drain task; this call does not wait for the HTTP
+        round-trip.
+
+        Parameters
+        ----------
+        output_interface : DiscordInput
+            The input protocol containing the message to send.
+        """
+        if self._url is None:
+            return
+
+        message_text = output_interface.action
+        if not message_text or message_text.isspace():
+            return
+
+        if len(message_text) > 2000:
+            logging.warning(
+                "Discord message truncated from %s to 2000 chars", len(message_text)
+            )
+            message_text = message_text[:2000]
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain(self._queue))
+
+        await self._queue.put(message_text)
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """
+        Drain the send queue, coalescing queued messages into single posts.
+
+        Blocks on the queue until a message arrives, then keeps pulling for
+        a short flush window and joins messages with newlines up to
+        Discord's content limit before issuing one webhook call.
+
+        Parameters
+        ----------
+        queue : asyncio.Queue
+            The send queue to drain.
+        """
+        while True:
+            buf = await queue.get()
+
+            while len(buf) <= MAX_COALESCED_LENGTH:
+                try:
+                    nxt = await asyncio.wait_for(queue.get(), timeout=FLUSH_WINDOW)
+                except asyncio.TimeoutError:
+                    break
+                if len(buf) + len(nxt) + 1 > MAX_COALESCED_LENGTH:
+                    await self._post(buf)
+                    buf = nxt
+                    continue
+                buf = f"{buf}\n{nxt}"
+
+            await self._post(buf)
+
+    async def _post(self, content: str) -> None:
+        """
+        Send a single webhook POST, honoring Discord rate-limit responses.
+
+        Parameters
+        ----------
+        content : str
+            The message content to post.
+        """
+        # connect() drops messages when no webhook URL is configured, but
+        # narrow the Optional here for the type checker.
+        url = self._url
+        if url is None:
+            return
+
+        # Pre-encode with orjson and pass raw bytes so aiohttp skips its
+        # per-call stdlib json.dumps on the hot send path.
+        body = orjson.dumps({"content": content})
+
+        try:
+            session = self._get_session()
+            async with session.post(
+                url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=self._timeout,
+            ) as response:
+                if response.status == 429:
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                    logging.warning(
+                        "Discord rate limited; retrying in %ss", retry_after
+                    )
+                    await asyncio.sleep(retry_after)
+                    await self._post(content)
+                elif response.status >= 200 and response.status < 300:
+                    logging.info("Discord message sent successfully")
+                else:
+                    text = await response.text()
+                    logging.error(
+                        "Discord webhook returned %s: %s", response.status, text
+                    )
+        except Exception as e:
+            logging.error("Failed to send Discord message: %s", e)
+
+    async def aclose(self) -> None:
+        """
+        Stop the drain worker.
+
+        The shared HTTP session is left open for other consumers; it is
+        torn down process-wide by ``providers._http``.
+        """
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from actions.base import Interface
+
+
+@dataclass
+class DiscordInput:
+    """Input interface for discord action."""
+
+    action: str = ""
+
+
+class Discord(Interface):
+    """Post a message to a Discord channel."""
+
+    input: DiscordInput
+    output: DiscordInput
@@ -317,6 +317,35 @@ class ActionOrchestrator:
         """
         self._stop_event.set()
         self._connector_executor.shutdown(wait=True)
+        self._close_connectors()
+
+    def _close_connectors(self):
+        """
+        Best-effort async cleanup of connector-held resources.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Called from within a running loop; connectors will be cleaned
+            # up when the loop itself shuts down.
+            return
+
+        # One private loop for all connectors: asyncio.run() would reset the
+        # thread's event loop to None after every connector, breaking any
+        # later asyncio use (and repeated stop()/__del__ calls).
+        loop = asyncio.new_event_loop()
+        try:
+            for agent_action in self._config.agent_actions:
+                try:
+                    loop.run_until_complete(agent_action.connector.aclose())
+                except Exception as e:
+                    logging.debug(
+                        f"Error closing connector {agent_action.llm_label}: {e}"
+                    )
+        finally:
+            loop.close()
 
     def __del__(self):
         """
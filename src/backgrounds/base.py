@@ -31,6 +31,17 @@ class Background(T.Generic[ConfigType]):
         self.config = config
         self.name = getattr(config, "name", type(self).__name__)
 
+    def deferred_start(self) -> None:
+        """
+        Start providers owned by this background.
+
+        Called by the orchestrator after all backgrounds are constructed, so
+        slow device/network initialization runs concurrently on the worker
+        threads instead of serializing inside ``__init__``. Subclasses that
+        own providers should override this and call ``provider.start()`` here.
+        """
+        pass
+
     def run(self) -> None:
         """
         Run the background process.
@@ -62,6 +62,11 @@ class BackgroundOrchestrator:
         background : Background
             The background task to run.
         """
+        try:
+            background.deferred_start()
+        except Exception as e:
+            logging.error(f"Error starting background {background.name}: {e}")
+
         while not self._stop_event.is_set():
             try:
                 background.run()
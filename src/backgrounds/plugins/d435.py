@@ -13,5 +13,10 @@ class D435(Background[BackgroundConfig]):
         super().__init__(config)
 
         self.d435_provider = D435Provider()
-        self.d435_provider.start()
         logging.info("Initiated D435 Provider in background")
+
+    def deferred_start(self) -> None:
+        """
+        Start the D435 provider.
+        """
+        self.d435_provider.start()
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from backgrounds.base import Background, BackgroundConfig
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
@@ -25,6 +25,8 @@ class ElevenLabsTTSConfig(BackgroundConfig):
         Output audio format.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: Optional[str] = Field(default=None, description="OM API key")
     elevenlabs_api_key: Optional[str] = Field(
         default=None, description="Eleven Labs API key"
@@ -64,15 +66,22 @@ class ElevenLabsTTS(Background[ElevenLabsTTSConfig]):
             model_id=model_id,
             output_format=output_format,
         )
-        self.tts.start()
+        logging.info("Eleven Labs TTS Provider initialized in background")
 
-        # Configure Eleven Labs TTS Provider to ensure settings are applied
+    def deferred_start(self) -> None:
+        """
+        Start the Eleven Labs TTS provider.
+
+        Reconfigures the provider first so the settings from this plugin's
+        config are applied when the singleton already existed with different
+        parameters; configure() is a no-op when nothing changed.
+        """
         self.tts.configure(
             url="https://api.openmind.org/api/core/elevenlabs/tts",
-            api_key=api_key,
-            elevenlabs_api_key=elevenlabs_api_key,
-            voice_id=voice_id,
-            model_id=model_id,
-            output_format=output_format,
+            api_key=self.config.api_key,
+            elevenlabs_api_key=self.config.elevenlabs_api_key,
+            voice_id=self.config.voice_id,
+            model_id=self.config.model_id,
+            output_format=self.config.output_format,
         )
-        logging.info("Eleven Labs TTS Provider initialized in background")
+        self.tts.start()
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from backgrounds.base import Background, BackgroundConfig
 from providers.gps_provider import GpsProvider
@@ -17,6 +17,8 @@ class GpsConfig(BackgroundConfig):
         Serial port for GPS device.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     serial_port: Optional[str] = Field(
         default=None, description="Serial port for GPS device"
     )
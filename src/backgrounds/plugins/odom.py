@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from backgrounds.base import Background, BackgroundConfig
 from providers.odom_provider import OdomProvider
@@ -21,6 +21,8 @@ class OdomConfig(BackgroundConfig):
         Unitree Ethernet channel.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     use_zenoh: bool = Field(default=False, description="Whether to use Zenoh")
     URID: str = Field(default="", description="Unique Robot ID")
     unitree_ethernet: Optional[str] = Field(
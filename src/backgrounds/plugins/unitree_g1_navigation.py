@@ -12,5 +12,10 @@ class UnitreeG1Navigation(Background[BackgroundConfig]):
     def __init__(self, config: BackgroundConfig):
         super().__init__(config)
         self.unitree_g1_navigation_provider = UnitreeG1NavigationProvider()
-        self.unitree_g1_navigation_provider.start()
         logging.info("Unitree G1 Navigation Provider initialized in background")
+
+    def deferred_start(self) -> None:
+        """
+        Start the Unitree G1 Navigation provider.
+        """
+        self.unitree_g1_navigation_provider.start()
@@ -17,7 +17,12 @@ class UnitreeGo2LidarLocalization(Background[BackgroundConfig]):
         self.unitree_go2_lidar_localization_provider = (
             UnitreeGo2LidarLocalizationProvider()
         )
-        self.unitree_go2_lidar_localization_provider.start()
         logging.info(
             "Unitree Go2 Lidar Localization Provider initialized in background"
         )
+
+    def deferred_start(self) -> None:
+        """
+        Start the Unitree Go2 Lidar Localization provider.
+        """
+        self.unitree_go2_lidar_localization_provider.start()
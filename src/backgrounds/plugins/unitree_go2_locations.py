@@ -1,6 +1,6 @@
 import logging
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from backgrounds.base import Background, BackgroundConfig
 from providers.unitree_go2_locations_provider import UnitreeGo2LocationsProvider
@@ -20,6 +20,8 @@ class UnitreeGo2LocationsConfig(BackgroundConfig):
         Refresh interval in seconds.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     base_url: str = Field(
         default="http://localhost:5000/maps/locations/list",
         description="Base URL for the locations API",
@@ -53,8 +55,12 @@ class UnitreeGo2Locations(Background[UnitreeGo2LocationsConfig]):
             timeout=timeout,
             refresh_interval=refresh_interval,
         )
-        self.locations_provider.start()
-
         logging.info(
             f"Locations Provider initialized in background (base_url: {base_url}, refresh: {refresh_interval}s)"
         )
+
+    def deferred_start(self) -> None:
+        """
+        Start the Unitree Go2 Locations provider.
+        """
+        self.locations_provider.start()
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from backgrounds.base import Background, BackgroundConfig
 from providers.unitree_go2_state_provider import UnitreeGo2StateProvider
@@ -17,6 +17,8 @@ class UnitreeGo2StateConfig(BackgroundConfig):
         Unitree Go2 Ethernet channel.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     unitree_ethernet: Optional[str] = Field(
         default=None, description="Unitree Go2 Ethernet channel"
     )
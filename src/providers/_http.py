@@ -0,0 +1,87 @@
+import asyncio
+import atexit
+import logging
+from typing import Optional
+
+import aiohttp
+
+_connector: Optional[aiohttp.TCPConnector] = None
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Return the process-wide shared aiohttp TCP connector.
+
+    Created lazily on first use so it binds to the running event loop. The
+    shared connector amortizes DNS caching, TLS session resumption and file
+    descriptor usage across every aiohttp consumer in the process.
+
+    Returns
+    -------
+    aiohttp.TCPConnector
+        The shared TCP connector.
+    """
+    global _connector
+    if _connector is None or _connector.closed:
+        _connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+    return _connector
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide shared aiohttp client session.
+
+    The session rides the shared connector but does not own it, so closing
+    the session leaves the connection pool available to other consumers.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+        The shared client session.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=get_shared_connector(),
+            connector_owner=False,
+        )
+    return _session
+
+
+async def close_shared_session() -> None:
+    """
+    Close the shared session and connector, releasing pooled connections.
+    """
+    global _connector, _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+    if _connector is not None and not _connector.closed:
+        await _connector.close()
+    _connector = None
+
+
+def _close_at_exit() -> None:
+    """
+    Best-effort teardown of the shared pool at interpreter shutdown.
+    """
+    if _session is None and _connector is None:
+        return
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            asyncio.run(close_shared_session())
+        except Exception as e:
+            logging.debug(f"Error closing shared HTTP session at exit: {e}")
+
+
+atexit.register(_close_at_exit)
@@ -58,6 +58,39 @@ class ElevenLabsTTSProvider:
         self._model_id = model_id
         self._output_format = output_format
 
+        self._msg_template = self._build_msg_template()
+        self._pending_q = self._audio_stream._pending_requests
+        self._cfg_key = (
+            url,
+            api_key,
+            elevenlabs_api_key,
+            voice_id,
+            model_id,
+            output_format,
+            enable_tts_interrupt,
+        )
+
+    def _build_msg_template(self) -> dict:
+        """
+        Build the reusable template for pending TTS messages.
+
+        Precomputed whenever the TTS parameters change so each enqueue only
+        copies the template instead of rebuilding and merging dicts.
+
+        Returns
+        -------
+        dict
+            Template dictionary with the current TTS request parameters.
+        """
+        template = {
+            "voice_id": self._voice_id,
+            "model_id": self._model_id,
+            "output_format": self._output_format,
+        }
+        if self.elevenlabs_api_key:
+            template["elevenlabs_api_key"] = self.elevenlabs_api_key
+        return template
+
     def configure(
         self,
         url: str = "https://api.openmind.org/api/core/elevenlabs/tts",
@@ -86,20 +119,31 @@ class ElevenLabsTTSProvider:
         enable_tts_interrupt : bool
             If True, enables TTS interrupt when ASR detects speech.
         """
-        restart_needed = (
-            url != self._audio_stream._url
-            or api_key != self.api_key
-            or elevenlabs_api_key != self.elevenlabs_api_key
-            or voice_id != self._voice_id
-            or model_id != self._model_id
-            or output_format != self._output_format
-            or enable_tts_interrupt != self._enable_tts_interrupt
+        new_key = (
+            url,
+            api_key,
+            elevenlabs_api_key,
+            voice_id,
+            model_id,
+            output_format,
+            enable_tts_interrupt,
         )
 
-        if not restart_needed:
+        # Fast path: the common re-apply of an unchanged config is a single
+        # tuple compare.
+        if new_key == self._cfg_key:
             return
 
-        if self.running:
+        # Only stream-level settings require tearing down the audio stream;
+        # voice_id/model_id/output_format/elevenlabs_api_key are per-request
+        # payload fields.
+        stream_restart_needed = (
+            url != self._cfg_key[0]
+            or api_key != self.api_key
+            or enable_tts_interrupt != self._enable_tts_interrupt
+        )
+
+        if stream_restart_needed and self.running:
             self.stop()
 
         self.api_key = api_key
@@ -108,12 +152,18 @@ class ElevenLabsTTSProvider:
         self._model_id = model_id
         self._output_format = output_format
         self._enable_tts_interrupt = enable_tts_interrupt
+        self._msg_template = self._build_msg_template()
+        self._cfg_key = new_key
+
+        if not stream_restart_needed:
+            return
 
         self._audio_stream: AudioOutputStream = AudioOutputStream(
             url=url,
             headers={"x-api-key": api_key} if api_key else None,
             enable_tts_interrupt=enable_tts_interrupt,
         )
+        self._pending_q = self._audio_stream._pending_requests
         self._audio_stream.start()
 
     def register_tts_state_callback(self, tts_state_callback: Optional[Callable]):
@@ -142,19 +192,10 @@ class ElevenLabsTTSProvider:
         dict
             A dictionary containing the TTS request parameters.
         """
-        logging.info(f"audio_stream: {text}")
-        elevenlabs_api_key = (
-            {"elevenlabs_api_key": self.elevenlabs_api_key}
-            if self.elevenlabs_api_key
-            else {}
-        )
-        return {
-            "text": text,
-            "voice_id": self._voice_id,
-            "model_id": self._model_id,
-            "output_format": self._output_format,
-            **elevenlabs_api_key,
-        }
+        logging.info("audio_stream: %s", text)
+        message = self._msg_template.copy()
+        message["text"] = text
+        return message
 
     def add_pending_message(self, message: Union[str, dict]):
         """
@@ -184,7 +225,7 @@ class ElevenLabsTTSProvider:
         int
             The number of pending messages.
         """
-        return self._audio_stream._pending_requests.qsize()
+        return self._pending_q.qsize()
 
     def start(self):
         """
@@ -5,6 +5,7 @@ import time
 from queue import Empty, Full
 from typing import Dict, List, Optional, Union
 
+import numpy as np
 import zenoh
 
 from runtime.logging import LoggingConfig, get_logging_config, setup_logging
@@ -15,7 +16,7 @@ from .singleton import singleton
 
 def simple_paths_processor(
     data_queue: mp.Queue,
-    control_queue: mp.Queue,
+    stop_event,
     logging_config: Optional[LoggingConfig] = None,
 ):
     """
@@ -25,8 +26,8 @@ def simple_paths_processor(
     ----------
     data_queue : mp.Queue
         Queue for receiving paths data.
-    control_queue : mp.Queue
-        Queue for sending control commands.
+    stop_event : mp.Event
+        Event signaling the processor to shut down.
     """
     setup_logging("rplidar_processor", logging_config=logging_config)
 
@@ -39,24 +40,19 @@ def simple_paths_processor(
         msg: zenoh.Sample
             The message containing paths data.
         """
-        paths = sensor_msgs.Paths.deserialize(msg.payload.to_bytes())
-        msg_time = paths.header.stamp.sec + paths.header.stamp.nanosec * 1e-9
-        current_time = time.time()
-        latency = current_time - msg_time
-        logging.debug(f"Received paths with latency: {latency:.6f} seconds")
-        logging.info(f"Received paths: {paths.paths}")
+        # Keep Zenoh's IO thread minimal: just hand the raw payload bytes
+        # to the consumer, which deserializes off this thread.
+        payload = msg.payload.to_bytes()
 
         try:
-            data_queue.put_nowait(paths)
+            data_queue.put_nowait(payload)
         except Full:
             try:
                 data_queue.get_nowait()
-                data_queue.put_nowait(paths)
+                data_queue.put_nowait(payload)
             except Empty:
                 pass
 
-    running = True
-
     try:
         session = open_zenoh_session()
         session.declare_subscriber("om/paths", paths_callback)
@@ -64,16 +60,7 @@ def simple_paths_processor(
     except Exception as e:
         logging.error(f"Failed to open Zenoh session: {e}")
 
-    while running:
-        try:
-            cmd = control_queue.get_nowait()
-            if cmd == "STOP":
-                running = False
-                break
-        except Empty:
-            pass
-
-        time.sleep(0.1)
+    stop_event.wait()
 
 
 @singleton
@@ -82,6 +69,8 @@ class SimplePathsProvider:
     Singleton class to provide simple path processing using Zenoh.
     """
 
+    _EMPTY_LIDAR_STRING = "You are surrounded by objects and cannot safely move in any direction. DO NOT MOVE."
+
     def __init__(self):
         self.session = None
         self.paths = None
@@ -95,15 +84,25 @@ class SimplePathsProvider:
         # Valid paths list
         self._valid_paths = []
 
+        # Key of the last processed paths message, for duplicate dropping
+        self._last_paths_key: Optional[tuple] = None
+
         # LLM string
         self._lidar_string = ""
 
         # Path angles for movement options
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
 
-        # Data Queues for multiprocessing
-        self.data_queue = mp.Queue(maxsize=5)
-        self.control_queue = mp.Queue()
+        # Precomputed movement strings indexed by a 4-bit
+        # (turn_left, advance, turn_right, retreat) key; there are only 16
+        # possible outputs, so the hot path is a table lookup.
+        self._lidar_table = self._build_lidar_table()
+
+        # Latest-value slot: consumers only care about the newest paths
+        # message, so a single-entry queue lets the callback overwrite a
+        # stale frame instead of queueing a backlog.
+        self.data_queue = mp.Queue(maxsize=1)
+        self._stop_event_mp = mp.Event()
 
         # Thread control
         self._simple_paths_processor_thread = None
@@ -120,7 +119,7 @@ class SimplePathsProvider:
         ):
             self._simple_paths_processor_thread = mp.Process(
                 target=simple_paths_processor,
-                args=(self.data_queue, self.control_queue, get_logging_config()),
+                args=(self.data_queue, self._stop_event_mp, get_logging_config()),
             )
             self._simple_paths_processor_thread.start()
             logging.info("SimplePathsProvider started.")
@@ -143,7 +142,7 @@ class SimplePathsProvider:
         self._stop_event.set()
 
         if self._simple_paths_processor_thread:
-            self.control_queue.put("STOP")
+            self._stop_event_mp.set()
             self._simple_paths_processor_thread.join()
             logging.info("SimplePathsProvider stopped.")
 
@@ -157,61 +156,76 @@ class SimplePathsProvider:
         """
         while not self._stop_event.is_set():
             try:
-                paths = self.data_queue.get_nowait()
-
-                self.turn_left = []
-                self.turn_right = []
-                self.advance = []
-                self.retreat = False
-
-                for path in paths.paths:
-                    if path < 3:
-                        self.turn_left.append(path)
-                    elif path >= 3 and path <= 5:
-                        self.advance.append(path)
-                    elif path < 9:
-                        self.turn_right.append(path)
-                    elif path == 9:
-                        self.retreat = True
-
-                self._valid_paths = paths
-                self._lidar_string = self._generate_movement_string(paths)
-
+                payload = self.data_queue.get(timeout=0.5)
             except Empty:
-                time.sleep(0.1)
                 continue
 
-    def _generate_movement_string(self, valid_paths: list) -> str:
+            # A malformed payload must not kill the thread; log and wait
+            # for the next frame.
+            try:
+                paths = sensor_msgs.Paths.deserialize(payload)
+                msg_time = paths.header.stamp.sec + paths.header.stamp.nanosec * 1e-9
+                latency = time.time() - msg_time
+                logging.debug(f"Received paths with latency: {latency:.6f} seconds")
+                logging.info(f"Received paths: {paths.paths}")
+
+                # Drop duplicate frames: the safe-direction set rarely
+                # changes, so skip reclassification for identical indices.
+                # Keyed on the indices rather than the payload bytes since
+                # the header stamp makes every payload unique.
+                paths_key = tuple(paths.paths)
+                if paths_key == self._last_paths_key:
+                    continue
+                self._last_paths_key = paths_key
+
+                arr = np.fromiter(paths.paths, dtype=np.int8)
+                valid = arr[(arr >= 0) & (arr <= 9)]
+
+                self.turn_left = valid[valid < 3].tolist()
+                self.advance = valid[(valid >= 3) & (valid <= 5)].tolist()
+                self.turn_right = valid[(valid >= 6) & (valid <= 8)].tolist()
+                self.retreat = bool((valid == 9).any())
+
+                self._valid_paths = list(paths.paths)
+                if not self._valid_paths:
+                    self._lidar_string = self._EMPTY_LIDAR_STRING
+                else:
+                    key = (
+                        (bool(self.turn_left) << 3)
+                        | (bool(self.advance) << 2)
+                        | (bool(self.turn_right) << 1)
+                        | bool(self.retreat)
+                    )
+                    self._lidar_string = self._lidar_table[key]
+
+            except Exception as e:
+                logging.error(f"Error processing paths message: {e}")
+
+    @staticmethod
+    def _build_lidar_table() -> tuple:
         """
-        Generate movement direction string based on valid paths.
-
-        Parameters
-        ----------
-        valid_paths : list
-            A list of valid paths represented as integers.
-            Each integer corresponds to a specific movement direction.
+        Build the 16 possible movement strings, one per direction combination.
 
         Returns
         -------
-        str
-            A string describing the safe movement directions based on the valid paths.
+        tuple
+            Movement strings indexed by
+            ``(turn_left << 3) | (advance << 2) | (turn_right << 1) | retreat``.
         """
-        if not valid_paths:
-            return "You are surrounded by objects and cannot safely move in any direction. DO NOT MOVE."
-
-        parts = ["The safe movement directions are: {"]
-
-        if self.turn_left:
-            parts.append("'turn left', ")
-        if self.advance:
-            parts.append("'move forwards', ")
-        if self.turn_right:
-            parts.append("'turn right', ")
-        if self.retreat:
-            parts.append("'move back', ")
-
-        parts.append("'stand still'}. ")
-        return "".join(parts)
+        table = []
+        for key in range(16):
+            parts = ["The safe movement directions are: {"]
+            if key & 0b1000:
+                parts.append("'turn left', ")
+            if key & 0b0100:
+                parts.append("'move forwards', ")
+            if key & 0b0010:
+                parts.append("'turn right', ")
+            if key & 0b0001:
+                parts.append("'move back', ")
+            parts.append("'stand still'}. ")
+            table.append("".join(parts))
+        return tuple(table)
 
     @property
     def valid_paths(self) -> Optional[List]:
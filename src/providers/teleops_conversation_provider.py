@@ -1,14 +1,26 @@
+import atexit
 import logging
+import queue
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from .singleton import singleton
 
+# How long the worker waits for additional messages before flushing a batch,
+# and the maximum batch size posted in one request.
+BATCH_WINDOW = 0.05
+MAX_BATCH_SIZE = 32
+
+# Sentinel telling the worker to flush whatever is queued and exit.
+_STOP_SENTINEL = object()
+
 
 class MessageType(Enum):
     """
@@ -19,7 +31,7 @@ class MessageType(Enum):
     ROBOT = "robot"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationMessage:
     """
     Represents a conversation message with type, content, and timestamp.
@@ -28,6 +40,16 @@ class ConversationMessage:
     message_type: MessageType
     content: str
     timestamp: float
+    _type_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Cache the message-type string for serialization.
+
+        Storing the plain string lets to_dict skip the enum descriptor
+        lookup on every call.
+        """
+        object.__setattr__(self, "_type_str", self.message_type.value)
 
     def to_dict(self) -> dict:
         """
@@ -39,7 +61,7 @@ class ConversationMessage:
             Dictionary representation of the ConversationMessage.
         """
         return {
-            "type": self.message_type.value,
+            "type": self._type_str,
             "content": self.content,
             "timestamp": self.timestamp,
         }
@@ -79,7 +101,110 @@ class TeleopsConversationProvider:
     ):
         self.api_key = api_key
         self.base_url = base_url
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._enabled = bool(api_key)
+
+        # Persistent session with a keep-alive pool so repeat posts reuse
+        # the TLS connection instead of handshaking per message.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        if api_key:
+            self._session.headers["Authorization"] = f"Bearer {api_key}"
+        self._session.headers["Content-Type"] = "application/json"
+
+        # Single worker thread draining a plain queue: enqueuing a message
+        # is just a queue put, with none of the per-submit Future and
+        # condition-variable allocations of an executor.
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker_thread = threading.Thread(target=self._worker, daemon=True)
+        self._worker_thread.start()
+
+        # Flush queued messages on interpreter exit so a clean shutdown
+        # does not drop in-flight conversation telemetry.
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """
+        Stop the worker thread, flushing any queued messages first.
+        """
+        if not self._worker_thread.is_alive():
+            return
+
+        self._queue.put(_STOP_SENTINEL)
+        self._worker_thread.join(timeout=5)
+
+    def _worker(self) -> None:
+        """
+        Drain the message queue, coalescing bursts into batched HTTP POSTs.
+
+        Blocks until a message arrives, then keeps pulling for a short
+        window so chatty exchanges are stored with one request instead of
+        one TCP/TLS round-trip per message. Exits after flushing the queue
+        when the stop sentinel is received.
+        """
+        while True:
+            message = self._queue.get()
+            if message is _STOP_SENTINEL:
+                self._flush()
+                return
+
+            batch = [message]
+            stopping = False
+            deadline = time.monotonic() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if message is _STOP_SENTINEL:
+                    stopping = True
+                    break
+                batch.append(message)
+            self._store_batch_worker(batch)
+
+            if stopping:
+                self._flush()
+                return
+
+    def _flush(self) -> None:
+        """
+        Post everything left in the queue without waiting for new messages.
+        """
+        batch = []
+        while True:
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if message is _STOP_SENTINEL:
+                continue
+            batch.append(message)
+            if len(batch) >= MAX_BATCH_SIZE:
+                self._store_batch_worker(batch)
+                batch = []
+        if batch:
+            self._store_batch_worker(batch)
+
+    @staticmethod
+    def _clean(content: str) -> str:
+        """
+        Trim surrounding whitespace, avoiding a copy when already clean.
+
+        Parameters
+        ----------
+        content : str
+            The message content to clean.
+
+        Returns
+        -------
+        str
+            The content without leading or trailing whitespace.
+        """
+        if content and not content[0].isspace() and not content[-1].isspace():
+            return content
+        return content.strip()
 
     def store_user_message(self, content: str) -> None:
         """
@@ -90,9 +215,12 @@ class TeleopsConversationProvider:
         content : str
             The content of the user message.
         """
+        if not self._enabled:
+            return
+
         message = ConversationMessage(
             message_type=MessageType.USER,
-            content=content.strip(),
+            content=self._clean(content),
             timestamp=time.time(),
         )
         self._store_message(message)
@@ -106,61 +234,61 @@ class TeleopsConversationProvider:
         content : str
             The content of the robot message.
         """
+        if not self._enabled:
+            return
+
         message = ConversationMessage(
             message_type=MessageType.ROBOT,
-            content=content.strip(),
+            content=self._clean(content),
             timestamp=time.time(),
         )
         self._store_message(message)
 
-    def _store_message_worker(self, message: ConversationMessage) -> None:
+    def _store_batch_worker(self, messages: list) -> None:
         """
-        Worker method to store a conversation message via HTTP POST.
+        Worker method to store a batch of conversation messages via HTTP POST.
 
         Parameters
         ----------
-        message : ConversationMessage
-            The conversation message to store.
+        messages : list of ConversationMessage
+            The conversation messages to store.
         """
         if self.api_key is None or self.api_key == "":
             logging.debug("API key is missing. Cannot store conversation message.")
             return
 
-        if not message.content or not message.content.strip():
+        messages = [m for m in messages if m.content and m.content.strip()]
+        if not messages:
             logging.debug("Empty content, skipping conversation storage")
             return
 
         try:
-            request = requests.post(
-                self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=message.to_dict(),
-                timeout=2,
-            )
+            # Pre-encode with orjson; passing raw bytes skips requests'
+            # stdlib json.dumps on every post.
+            body = orjson.dumps({"messages": [m.to_dict() for m in messages]})
+            request = self._session.post(self.base_url, data=body, timeout=2)
 
             if request.status_code == 200:
                 logging.debug(
-                    f"Successfully stored {message.message_type.value} message to conversation"
+                    f"Successfully stored {len(messages)} message(s) to conversation"
                 )
             else:
                 logging.debug(
-                    f"Failed to store {message.message_type.value} message: {request.status_code} - {request.text}"
+                    f"Failed to store {len(messages)} message(s): {request.status_code} - {request.text}"
                 )
         except Exception as e:
-            logging.debug(
-                f"Error storing {message.message_type.value} conversation message: {str(e)}"
-            )
+            logging.debug(f"Error storing conversation message batch: {str(e)}")
 
     def _store_message(self, message: ConversationMessage) -> None:
         """
-        Submit the message storage task to the executor.
+        Hand the message to the background worker thread.
 
         Parameters
         ----------
         message : ConversationMessage
             The conversation message to store.
         """
-        self.executor.submit(self._store_message_worker, message)
+        self._queue.put(message)
 
     def is_enabled(self) -> bool:
         """
@@ -171,4 +299,4 @@ class TeleopsConversationProvider:
         bool
             True if the API key is set, False otherwise.
         """
-        return self.api_key is not None and self.api_key != ""
+        return self._enabled
@@ -50,6 +50,7 @@ class UnitreeG1LocationsProvider:
         self.timeout = timeout
         self.refresh_interval = refresh_interval
         self._locations: Dict[str, Dict] = {}
+        self._etag: Optional[str] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
@@ -93,12 +94,18 @@ class UnitreeG1LocationsProvider:
         if not self.base_url:
             return
         try:
-            resp = requests.get(self.base_url, timeout=self.timeout)
+            headers = {"If-None-Match": self._etag} if self._etag else None
+            resp = requests.get(self.base_url, timeout=self.timeout, headers=headers)
+
+            if resp.status_code == 304:
+                logging.debug("Locations unchanged (304); skipping parse")
+                return
             if resp.status_code < 200 or resp.status_code >= 300:
                 logging.error(
                     f"Location list API returned {resp.status_code}: {resp.text}"
                 )
                 return
+            self._etag = resp.headers.get("ETag")
             data = resp.json()
             raw_message = data.get("message") if isinstance(data, dict) else None
             if raw_message and isinstance(raw_message, str):
@@ -32,6 +32,7 @@ class ZenohListenerProvider:
             logging.error(f"Error opening Zenoh client: {e}")
 
         self.sub_topic = topic
+        self._subscriber = None
 
         self.running: bool = False
 
@@ -43,11 +44,25 @@ class ZenohListenerProvider:
         ----------
         message_callback : Callable
             The function that will be called with each incoming Zenoh sample.
+
+        Raises
+        ------
+        RuntimeError
+            If the Zenoh session is not available.
         """
-        if self.session is not None:
-            self.session.declare_subscriber(self.sub_topic, message_callback)
-        else:
-            logging.error("Cannot register callback; Zenoh session is not available.")
+        if self.session is None:
+            raise RuntimeError(
+                "Cannot register callback; Zenoh session is not available."
+            )
+
+        # Re-registering would declare a duplicate subscriber and double
+        # per-message work in the Zenoh router.
+        if self._subscriber is not None:
+            return
+
+        self._subscriber = self.session.declare_subscriber(
+            self.sub_topic, message_callback
+        )
 
     def start(self, message_callback: Optional[Callable] = None):
         """
@@ -75,5 +90,13 @@ class ZenohListenerProvider:
         """
         self.running = False
 
+        if self._subscriber is not None:
+            # Undeclare before closing so in-flight callbacks drain cleanly.
+            try:
+                self._subscriber.undeclare()
+            except Exception as e:
+                logging.debug(f"Error undeclaring Zenoh subscriber: {e}")
+            self._subscriber = None
+
         if self.session is not None:
             self.session.close()
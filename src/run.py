@@ -3,12 +3,22 @@ import logging
 import multiprocessing as mp
 import os
 import shutil
+import sys
 from typing import Optional, Tuple
 
 import dotenv
 import json5
 import typer
 
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        # uvloop is an optional accelerator; fall back to the default loop.
+        pass
+
 from runtime.logging import setup_logging
 from runtime.multi_mode.config import load_mode_config
 from runtime.multi_mode.cortex import ModeCortexRuntime
@@ -24,6 +24,12 @@ def create_zenoh_config(network_discovery: bool = True) -> zenoh.Config:
         config.insert_json5("mode", '"client"')
         config.insert_json5("connect/endpoints", '["tcp/127.0.0.1:7447"]')
 
+    # Disable transmit-queue batching: zenoh holds small messages back for
+    # up to ~1 ms to coalesce them into larger frames, which adds avoidable
+    # latency on the low-rate, latency-sensitive topics this runtime
+    # publishes (paths, cmd_vel, status).
+    config.insert_json5("transport/link/tx/queue/batching/time_limit", "0")
+
     return config
 
 
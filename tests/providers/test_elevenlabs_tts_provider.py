@@ -72,44 +72,48 @@ def test_configure_restart_needed_api_key_change():
         mock_stop.assert_called_once()
 
 
-def test_configure_restart_needed_elevenlabs_api_key_change():
-    """Test restart is triggered when ElevenLabs API key changes."""
+def test_configure_no_restart_elevenlabs_api_key_change():
+    """Test ElevenLabs API key change updates the payload without a restart."""
     provider = ElevenLabsTTSProvider(elevenlabs_api_key="original_key")
     provider.running = True
 
     with patch.object(provider, "stop") as mock_stop:
         provider.configure(elevenlabs_api_key="new_key")
-        mock_stop.assert_called_once()
+        mock_stop.assert_not_called()
+        assert provider.elevenlabs_api_key == "new_key"
 
 
-def test_configure_restart_needed_voice_id_change():
-    """Test restart is triggered when voice ID changes."""
+def test_configure_no_restart_voice_id_change():
+    """Test voice ID change updates the payload without a restart."""
     provider = ElevenLabsTTSProvider(voice_id="original_voice")
     provider.running = True
 
     with patch.object(provider, "stop") as mock_stop:
         provider.configure(voice_id="new_voice")
-        mock_stop.assert_called_once()
+        mock_stop.assert_not_called()
+        assert provider.create_pending_message("hi")["voice_id"] == "new_voice"
 
 
-def test_configure_restart_needed_model_id_change():
-    """Test restart is triggered when model ID changes."""
+def test_configure_no_restart_model_id_change():
+    """Test model ID change updates the payload without a restart."""
     provider = ElevenLabsTTSProvider(model_id="original_model")
     provider.running = True
 
     with patch.object(provider, "stop") as mock_stop:
         provider.configure(model_id="new_model")
-        mock_stop.assert_called_once()
+        mock_stop.assert_not_called()
+        assert provider.create_pending_message("hi")["model_id"] == "new_model"
 
 
-def test_configure_restart_needed_output_format_change():
-    """Test restart is triggered when output format changes."""
+def test_configure_no_restart_output_format_change():
+    """Test output format change updates the payload without a restart."""
     provider = ElevenLabsTTSProvider(output_format="mp3_44100_128")
     provider.running = True
 
     with patch.object(provider, "stop") as mock_stop:
         provider.configure(output_format="mp3_22050_64")
-        mock_stop.assert_called_once()
+        mock_stop.assert_not_called()
+        assert provider.create_pending_message("hi")["output_format"] == "mp3_22050_64"
 
 
 def test_configure_no_restart_when_same_parameters():